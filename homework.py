@@ -1,7 +1,9 @@
 import logging
 import os
+import random
 import sys
 import time
+from functools import lru_cache
 from http import HTTPStatus
 
 import requests
@@ -17,8 +19,22 @@ TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN', None)
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID', None)
 
 RETRY_PERIOD = 600
+REQUEST_TIMEOUT = (5, 30)
+TELEGRAM_TIMEOUT = 10
+REQUEST_ATTEMPTS = 3
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 30
+BACKOFF_JITTER = 0.5
+RETRYABLE_STATUSES = (HTTPStatus.TOO_MANY_REQUESTS,
+                      HTTPStatus.INTERNAL_SERVER_ERROR,
+                      HTTPStatus.BAD_GATEWAY,
+                      HTTPStatus.SERVICE_UNAVAILABLE,
+                      HTTPStatus.GATEWAY_TIMEOUT)
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
 HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
+VALIDATOR_HEADERS = (('ETag', 'If-None-Match'),
+                     ('Last-Modified', 'If-Modified-Since'))
+RESPONSE_CACHE = {}
 
 HOMEWORK_ATTRIBUTES = ('id',
                        'status',
@@ -32,6 +48,7 @@ HOMEWORK_VERDICTS = {
     'reviewing': 'Работа взята на проверку ревьюером.',
     'rejected': 'Работа проверена: у ревьюера есть замечания.'
 }
+STATUS_MESSAGE_TEMPLATE = 'Изменился статус проверки работы "{}". {}'
 
 
 def check_tokens():
@@ -42,13 +59,10 @@ def check_tokens():
     tokens = (('PRACTICUM_TOKEN', PRACTICUM_TOKEN),
               ('TELEGRAM_TOKEN', TELEGRAM_TOKEN),
               ('TELEGRAM_CHAT_ID', TELEGRAM_CHAT_ID))
-    check_result = True
-    for name, token in tokens:
-        if not token:
-            logging.critical(f'Отсутствует токен {name}')
-            check_result = False
-    if not check_result:
-        raise KeyError('Проверьте доступность переменных окружения')
+    missing = [name for name, token in tokens if not token]
+    if missing:
+        logging.critical('Отсутствуют токены: %s', ', '.join(missing))
+        sys.exit('Проверьте доступность переменных окружения')
 
 
 def get_api_answer(timestamp):
@@ -57,34 +71,68 @@ def get_api_answer(timestamp):
     В случае успешного запроса должна вернуть ответ API,
     приведя его из формата JSON к типам данных Python.
     """
-    request_get_args = {
-        'url': ENDPOINT,
-        'headers': HEADERS,
-        'params': {'from_date': timestamp}
-    }
-    logging.debug(
-        'Отправляем запрос к url={url} c headers={headers}'
-        ' и params={params}'.format(**request_get_args)
-    )
-    try:
-        response = requests.get(
-            **request_get_args
-        )
-    except requests.RequestException as error:
-        raise ConnectionError(
-            'Проблема с запросом к url={url} c headers={headers}'
-            ' и params={params}: {error}'.format(**request_get_args,
-                                                 error=error)
+    params = {'from_date': timestamp}
+    headers = HEADERS
+    if RESPONSE_CACHE.get('from_date') == timestamp:
+        headers = {**HEADERS, **RESPONSE_CACHE['validators']}
+    logging.debug('Отправляем запрос к url=%s c params=%s', ENDPOINT, params)
+    for attempt in range(REQUEST_ATTEMPTS):
+        last_attempt = attempt == REQUEST_ATTEMPTS - 1
+        try:
+            response = requests.get(ENDPOINT, headers=headers, params=params,
+                                    timeout=REQUEST_TIMEOUT)
+        except requests.RequestException as error:
+            if last_attempt:
+                raise ConnectionError(
+                    f'Проблема с запросом к url={ENDPOINT}'
+                    f' c params={params}: {error}'
+                )
+            cause = error
+        else:
+            if response.status_code == HTTPStatus.OK:
+                answer = response.json()
+                cache_response(timestamp, response, answer)
+                return answer
+            if response.status_code == HTTPStatus.NOT_MODIFIED:
+                logging.debug('Нет изменений с момента предыдущего запроса')
+                if RESPONSE_CACHE.get('from_date') == timestamp:
+                    return RESPONSE_CACHE['answer']
+                return {'homeworks': [], 'current_date': timestamp}
+            if response.status_code not in RETRYABLE_STATUSES or last_attempt:
+                raise AnswerCodeError(
+                    f'Ошибка запроса: status_code {response.status_code},'
+                    f' reason {response.reason},'
+                    # f' text {response.text},'
+                    f' url {response.url}'
+                )
+            cause = (f'status_code {response.status_code},'
+                     f' reason {response.reason}')
+        delay = min(
+            BACKOFF_CAP,
+            BACKOFF_BASE * 2 ** attempt * (1 + random.random()
+                                           * BACKOFF_JITTER)
         )
+        logging.warning('Ошибка запроса к API: %s. Повторный запрос через'
+                        ' %.1f с', cause, delay)
+        time.sleep(delay)
 
-    if response.status_code != HTTPStatus.OK:
-        raise AnswerCodeError(
-            f'Ошибка запроса: status_code {response.status_code},'
-            f' reason {response.reason},'
-            # f' text {response.text},'
-            f' url {response.url}'
-        )
-    return response.json()
+
+def cache_response(timestamp, response, answer):
+    """Запоминает ETag и Last-Modified успешного ответа API.
+    При следующем запросе с тем же from_date они отправляются как
+    If-None-Match и If-Modified-Since, а на ответ 304 возвращается
+    сохранённый ответ.
+    """
+    validators = {
+        request_header: response.headers[response_header]
+        for response_header, request_header in VALIDATOR_HEADERS
+        if response_header in response.headers
+    }
+    RESPONSE_CACHE.clear()
+    if validators:
+        RESPONSE_CACHE.update(from_date=timestamp,
+                              validators=validators,
+                              answer=answer)
 
 
 def check_response(response: dict):
@@ -94,13 +142,12 @@ def check_response(response: dict):
     домашние задания, то проверяет были ли обновления с момента предыдущего
     запроса. Если были, то возвращает последнее домашнее задание.
     """
-    if not isinstance(response, dict):
-        raise TypeError('Response должен быть dict.')
-
-    if 'homeworks' not in response:
-        raise KeyError('Отсутствуют ожидаемые ключи в response')
-
-    homeworks = response['homeworks']
+    try:
+        homeworks = response['homeworks']
+    except TypeError:
+        raise TypeError('Response должен быть dict.') from None
+    except KeyError:
+        raise KeyError('Отсутствуют ожидаемые ключи в response') from None
 
     if not isinstance(homeworks, list):
         raise TypeError('Значения ключей response имеют неправильный тип')
@@ -117,12 +164,19 @@ def parse_status(homework):
     """
     if 'status' not in homework or 'homework_name' not in homework:
         raise KeyError('Атрибуты отсутствует в homework.')
-    homework_name = homework['homework_name']
-    status = homework['status']
+    return status_message(str(homework['homework_name']), homework['status'])
+
+
+@lru_cache(maxsize=512)
+def status_message(homework_name, status):
+    """Формирует сообщение об изменении статуса домашней работы.
+    Результат кешируется по паре (homework_name, status), поэтому для
+    работ, статус которых не менялся, строка повторно не собирается.
+    """
     if status not in HOMEWORK_VERDICTS:
         raise ValueError(f'Неожиданно принятое значение: {status}')
-    verdict = HOMEWORK_VERDICTS[status]
-    return f'Изменился статус проверки работы "{homework_name}". {verdict}'
+    return STATUS_MESSAGE_TEMPLATE.format(homework_name,
+                                          HOMEWORK_VERDICTS[status])
 
 
 def send_message(bot, message):
@@ -131,11 +185,12 @@ def send_message(bot, message):
         bot.send_message(
             chat_id=TELEGRAM_CHAT_ID,
             text=message,
+            timeout=TELEGRAM_TIMEOUT,
         )
     except Exception as error:
-        logging.error(f'Ошибка при отправке в Телеграмм {error}')
+        logging.error('Ошибка при отправке в Телеграмм %s', error)
         return False
-    logging.debug(f'Сообщение успешно отправлено в Телеграмм: {message}')
+    logging.debug('Сообщение успешно отправлено в Телеграмм: %s', message)
     return True
 
 
@@ -1,6 +1,7 @@
 import os
 import sys
 
+import pytest
 import pytest_timeout
 
 root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -53,3 +54,13 @@ pytest_timeout.write = write_timeout_reasons
 os.environ['PRACTICUM_TOKEN'] = 'sometoken'
 os.environ['TELEGRAM_TOKEN'] = '1234:abcdefg'
 os.environ['TELEGRAM_CHAT_ID'] = '12345'
+
+
+@pytest.fixture(autouse=True)
+def instant_backoff(monkeypatch, homework_module):
+    """Make the backoff pauses of get_api_answer instant.
+
+    Tests that need to observe or interrupt sleeping patch `time.sleep`
+    themselves on top of this fixture.
+    """
+    monkeypatch.setattr(homework_module.time, 'sleep', lambda secs: None)
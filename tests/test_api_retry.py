@@ -0,0 +1,87 @@
+import time
+from http import HTTPStatus
+
+import pytest
+import requests
+
+
+class FakeResponse:
+    def __init__(self, status_code, data=None):
+        self.status_code = status_code
+        self.reason = HTTPStatus(status_code).phrase
+        self.url = 'https://practicum.yandex.ru/api/'
+        self.headers = {}
+        self.data = data if data is not None else {}
+
+    def json(self):
+        return self.data
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls = []
+    monkeypatch.setattr(time, 'sleep', calls.append)
+    return calls
+
+
+def mock_requests_get(monkeypatch, outcomes):
+    """Replace requests.get with a stub returning `outcomes` in order."""
+    calls = []
+
+    def fake_get(*args, **kwargs):
+        calls.append(kwargs)
+        outcome = outcomes[len(calls) - 1]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(requests, 'get', fake_get)
+    return calls
+
+
+class TestGetApiAnswerRetry:
+    def test_retryable_status_then_ok(
+            self, monkeypatch, sleeps, current_timestamp, homework_module
+    ):
+        data = {'homeworks': [], 'current_date': current_timestamp}
+        calls = mock_requests_get(monkeypatch, [
+            FakeResponse(HTTPStatus.SERVICE_UNAVAILABLE),
+            FakeResponse(HTTPStatus.OK, data),
+        ])
+
+        assert homework_module.get_api_answer(current_timestamp) == data, (
+            'После ответа 503 запрос должен быть повторён, а ответ 200 '
+            'возвращён.'
+        )
+        assert len(calls) == 2
+        assert len(sleeps) == 1
+        assert sleeps[0] >= homework_module.BACKOFF_BASE
+
+    def test_client_error_is_not_retried(
+            self, monkeypatch, sleeps, current_timestamp, homework_module
+    ):
+        calls = mock_requests_get(monkeypatch, [
+            FakeResponse(HTTPStatus.UNAUTHORIZED),
+        ])
+
+        with pytest.raises(homework_module.AnswerCodeError):
+            homework_module.get_api_answer(current_timestamp)
+        assert len(calls) == 1, 'Ответ 401 не должен повторяться.'
+        assert not sleeps
+
+    def test_request_exception_is_retried(
+            self, monkeypatch, sleeps, current_timestamp, homework_module
+    ):
+        attempts = homework_module.REQUEST_ATTEMPTS
+        calls = mock_requests_get(
+            monkeypatch,
+            [requests.RequestException('Something wrong')] * attempts
+        )
+
+        with pytest.raises(ConnectionError):
+            homework_module.get_api_answer(current_timestamp)
+        assert len(calls) == attempts
+        assert len(sleeps) == attempts - 1
+        assert all(
+            delay <= homework_module.BACKOFF_CAP for delay in sleeps
+        )
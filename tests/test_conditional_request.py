@@ -0,0 +1,88 @@
+from http import HTTPStatus
+
+import pytest
+import requests
+
+import tests.check_utils as check_utils
+
+
+class NotModifiedResponse(check_utils.MockResponseGET):
+    def json(self):
+        raise AssertionError('Тело ответа 304 не должно разбираться.')
+
+
+@pytest.fixture
+def response_cache(monkeypatch, homework_module):
+    cache = {}
+    monkeypatch.setattr(homework_module, 'RESPONSE_CACHE', cache)
+    return cache
+
+
+class TestConditionalRequest:
+    def test_not_modified_without_cache(
+            self, monkeypatch, response_cache, current_timestamp,
+            homework_module
+    ):
+        monkeypatch.setattr(
+            requests, 'get',
+            lambda *args, **kwargs: NotModifiedResponse(
+                http_status=HTTPStatus.NOT_MODIFIED
+            )
+        )
+
+        answer = homework_module.get_api_answer(current_timestamp)
+
+        assert answer['homeworks'] == [], (
+            'На ответ 304 функция `get_api_answer` должна возвращать '
+            'пустой список домашних работ.'
+        )
+
+    def test_validators_are_sent_and_answer_replayed(
+            self, monkeypatch, response_cache, current_timestamp,
+            homework_module, data_with_new_hw_status
+    ):
+        sent_headers = []
+
+        def first_get(*args, headers=None, **kwargs):
+            sent_headers.append(headers)
+            response = check_utils.MockResponseGET(
+                data=data_with_new_hw_status
+            )
+            response.headers = {'ETag': '"abc"',
+                                'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}
+            return response
+
+        def second_get(*args, headers=None, **kwargs):
+            sent_headers.append(headers)
+            return NotModifiedResponse(http_status=HTTPStatus.NOT_MODIFIED)
+
+        monkeypatch.setattr(requests, 'get', first_get)
+        first = homework_module.get_api_answer(current_timestamp)
+        monkeypatch.setattr(requests, 'get', second_get)
+        second = homework_module.get_api_answer(current_timestamp)
+
+        assert 'If-None-Match' not in sent_headers[0]
+        assert sent_headers[1]['If-None-Match'] == '"abc"'
+        assert sent_headers[1]['If-Modified-Since'] == (
+            'Mon, 01 Jan 2024 00:00:00 GMT'
+        )
+        assert second == first
+
+    def test_validators_not_sent_for_other_timestamp(
+            self, monkeypatch, response_cache, current_timestamp,
+            homework_module
+    ):
+        response_cache.update(from_date=current_timestamp - 1,
+                              validators={'If-None-Match': '"abc"'},
+                              answer={})
+        sent_headers = []
+
+        def mock_get(*args, headers=None, **kwargs):
+            sent_headers.append(headers)
+            return check_utils.MockResponseGET()
+
+        monkeypatch.setattr(requests, 'get', mock_get)
+        homework_module.get_api_answer(current_timestamp)
+
+        assert 'If-None-Match' not in sent_headers[0]
+        assert not response_cache
@@ -0,0 +1,34 @@
+import pytest
+
+
+class TestStatusMessageCache:
+    def test_repeated_pair_is_cache_hit(self, homework_module):
+        homework_module.status_message.cache_clear()
+        homework = {'homework_name': 'hw123', 'status': 'approved'}
+
+        first = homework_module.parse_status(homework)
+        second = homework_module.parse_status(dict(homework))
+
+        assert first == second
+        assert homework_module.status_message.cache_info().hits == 1, (
+            'Повторный вызов с той же парой (homework_name, status) должен '
+            'брать сообщение из кеша.'
+        )
+
+    def test_unknown_status_is_not_cached(self, homework_module):
+        homework_module.status_message.cache_clear()
+        homework = {'homework_name': 'hw123', 'status': 'unknown'}
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                homework_module.parse_status(homework)
+        info = homework_module.status_message.cache_info()
+        assert info.hits == 0
+        assert info.currsize == 0
+
+    def test_unhashable_homework_name(self, homework_module):
+        homework = {'homework_name': ['hw123'], 'status': 'approved'}
+
+        assert homework_module.parse_status(homework).startswith(
+            'Изменился статус проверки работы "[\'hw123\']"'
+        )